@@ -5,8 +5,15 @@ Generic version - all configuration values are user-inputable.
 Ready for GitHub upload.
 """
 
-import json
+import asyncio
+import copy
+from functools import lru_cache
+
+import numpy as np
+import orjson
 from flask import Flask, render_template, request, jsonify
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
 
 from etf_fetcher import fetch_etf_data, validate_portfolio
 from monte_carlo import (
@@ -18,7 +25,63 @@ from monte_carlo import (
 )
 
 
+class ORJSONProvider(JSONProvider):
+    """
+    orjson-backed JSON provider.
+
+    The simulate response carries thousands of floats (percentile series
+    x years x persons); orjson formats them at C speed and serializes
+    NumPy arrays natively, so view code can hand over ndarrays without
+    .tolist() round trips.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+cache = Cache(app, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 3600})
+
+# Parse templates once; the UI is a single static page, so there is no
+# reason to stat + reparse index.html on every GET
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+
+# Serialized ETF payloads keyed by upper-case ISIN, so hot requests skip
+# both the dataclass construction and to_dict()
+_ETF_PAYLOAD_CACHE: dict[str, dict] = {}
+
+@lru_cache(maxsize=32)
+def _build_simulator(portfolio_key: tuple, n_simulations: int) -> MonteCarloSimulator:
+    """
+    Build (and memoize) a simulator for a portfolio key.
+
+    The dominant interactive workload is "tweak one input, re-run" with
+    an unchanged ETF mix, so the simulator with its precomputed portfolio
+    return/volatility is reused across requests. portfolio_key is a tuple
+    of (isin, allocation, annual_return, annual_volatility) tuples.
+    Callers must copy.copy the result and attach their own
+    contributions/rental so no request state leaks through the cache.
+    """
+    portfolio = [
+        PortfolioETF(isin=isin, allocation=allocation,
+                     annual_return=annual_return,
+                     annual_volatility=annual_volatility)
+        for isin, allocation, annual_return, annual_volatility in portfolio_key
+    ]
+    return MonteCarloSimulator(
+        portfolio=portfolio,
+        contributions=[],
+        n_simulations=n_simulations,
+        seed=None  # Random each time
+    )
 
 
 # Default configuration (can be overridden by user input)
@@ -54,24 +117,45 @@ DEFAULT_CONFIG = {
     'repayment_year': 2030
 }
 
-
 @app.route('/')
 def index():
     """Render the main UI."""
     return render_template('index.html', config=DEFAULT_CONFIG)
 
 
+def _etf_payload(isin: str):
+    """Return the serialized ETF payload for an ISIN, or None if not found."""
+    key = isin.upper().strip()
+    payload = _ETF_PAYLOAD_CACHE.get(key)
+    if payload is None:
+        data = fetch_etf_data(isin)
+        if not data:
+            return None
+        payload = data.to_dict()
+        _ETF_PAYLOAD_CACHE[key] = payload
+    return payload
+
+
+def _etf_response_ok(response) -> bool:
+    """Only cache successful lookups; a transient fetch failure must not
+    pin 'ETF not found' for the full cache timeout."""
+    return response.get_json().get('success', False)
+
+
 @app.route('/api/etf/<isin>')
+@cache.cached(timeout=3600,
+              key_prefix=lambda: f"etf:{request.view_args['isin'].upper()}",
+              response_filter=_etf_response_ok)
 def get_etf_info(isin: str):
     """Fetch ETF information by ISIN."""
-    data = fetch_etf_data(isin)
-    if data:
-        return jsonify({'success': True, 'data': data.to_dict()})
+    payload = _etf_payload(isin)
+    if payload:
+        return jsonify({'success': True, 'data': payload})
     return jsonify({'success': False, 'error': f'ETF not found: {isin}'})
 
 
 @app.route('/api/simulate', methods=['POST'])
-def run_simulation():
+async def run_simulation():
     """Run Monte Carlo simulation with provided parameters."""
     try:
         params = request.json
@@ -112,31 +196,35 @@ def run_simulation():
                 if isin and allocation > 0:
                     etf_list.append((isin, allocation))
         else:
-            # Legacy fallback
-            for i in range(1, 4):
-                isin = params.get(f'etf{i}_isin', '').strip()
-                allocation = float(item.get(f'etf{i}_allocation', 0))
-                if isin and allocation > 0:
-                    etf_list.append((isin, allocation))
+            # Legacy fallback: flat etf1_isin/etf1_allocation style fields
+            legacy = [
+                (params.get(f'etf{i}_isin', '').strip(),
+                 float(params.get(f'etf{i}_allocation', 0) or 0))
+                for i in range(1, 4)
+            ]
+            etf_list = [(isin, alloc) for isin, alloc in legacy
+                        if isin and alloc > 0]
         
         # Validate portfolio
         is_valid, error_msg = validate_portfolio(etf_list)
         if not is_valid:
             return jsonify({'success': False, 'error': error_msg})
         
-        # Fetch ETF data and build portfolio
-        portfolio = []
+        # Fetch ETF data concurrently (network-bound on cold cache) and build portfolio
+        tasks = [asyncio.to_thread(fetch_etf_data, isin) for isin, _ in etf_list]
+        etf_datas = await asyncio.gather(*tasks)
+
+        portfolio_key = []
         etf_info = []
-        for isin, allocation in etf_list:
-            data = fetch_etf_data(isin)
+        for (isin, allocation), data in zip(etf_list, etf_datas):
             if not data:
                 return jsonify({'success': False, 'error': f'Could not fetch data for {isin}'})
-            
-            portfolio.append(PortfolioETF(
-                isin=isin,
-                allocation=allocation / 100,  # Convert to decimal
-                annual_return=data.annual_return,
-                annual_volatility=data.annual_volatility
+
+            portfolio_key.append((
+                isin,
+                allocation / 100,  # Convert to decimal
+                data.annual_return,
+                data.annual_volatility
             ))
             etf_info.append(data.to_dict())
         
@@ -166,25 +254,19 @@ def run_simulation():
                 kerli_share=adult2_share
             )
         
-        # Run simulation
-        simulator = MonteCarloSimulator(
-            portfolio=portfolio,
-            contributions=contributions,
-            rental=rental,
-            n_simulations=10000,
-            seed=None  # Random each time
-        )
+        # Run simulation - shallow-copy the memoized simulator and attach
+        # this request's contributions/rental
+        simulator = copy.copy(_build_simulator(tuple(portfolio_key), 10000))
+        simulator.contributions = contributions
+        simulator.rental = rental
         
         start_year = int(params.get('start_year') or 2026)
         start_month = int(params.get('start_month') or 1)
         end_year = int(params.get('end_year') or 2040)
         
-        result = simulator.simulate(
-            start_year=start_year,
+        sim_kwargs = dict(
             start_month=start_month,
-            end_year=end_year,
             starting_capital=starting_capital,
-            starting_loans=starting_loans,
             annual_costs=float(params.get('annual_costs') or 0),
             withdrawal_rate=float(params.get('withdrawal_rate') or 0) / 100,
             withdrawal_start_year=int(params.get('withdrawal_start_year') or 2035),
@@ -193,9 +275,16 @@ def run_simulation():
             contribution_change_year=int(params['contribution_change_year']) if params.get('contribution_change_year') else None,
             contribution_change_factor=float(params.get('contribution_change_factor') or 1.0)
         )
+        result = await asyncio.to_thread(
+            simulator.simulate,
+            start_year=start_year,
+            end_year=end_year,
+            num_workers=None,  # auto-detect CPU cores
+            **sim_kwargs
+        )
         
-        # Calculate loan evolution
-        loan_evolution = calculate_loan_evolution(
+        # Calculate loan evolution as (names, (n_persons, n_years) matrix)
+        loan_names, loan_arr = calculate_loan_evolution(
             starting_loans=starting_loans,
             contributions=contributions,
             years=result.years,
@@ -209,73 +298,76 @@ def run_simulation():
             contribution_change_factor=float(params.get('contribution_change_factor') or 1.0)
         )
         
-        # Calculate total loans per year
-        total_loans = []
-        for i in range(len(result.years)):
-            year_total = sum(loan_evolution[person][i] for person in loan_evolution)
-            total_loans.append(round(year_total, 2))
-        
+        years_arr = np.asarray(result.years)
+        n_years = len(years_arr)
+        p50 = np.asarray(result.p50)
+        payouts = np.asarray(result.payouts_p50)
+
+        # Reduce loans across persons in one pass
+        total_loans_arr = loan_arr.sum(axis=0) if loan_arr.size else np.zeros(n_years)
+        total_loans = np.round(total_loans_arr, 2)
+
+        # Per-person dict view for the JSON payload (orjson handles ndarrays)
+        loan_evolution = {name: loan_arr[j] for j, name in enumerate(loan_names)}
+
         # Calculate profits (P50 balance - loans)
-        profits_p50 = [round(result.p50[i] - total_loans[i], 2) for i in range(len(result.years))]
-        
-        # Calculate balance breakdown using Monte Carlo P50 values
-        balance_breakdown = []
+        profits_p50 = np.round(p50 - total_loans_arr, 2)
+
+        # Calculate balance breakdown using Monte Carlo P50 values.
+        # All columns are built as year-indexed vectors, then zipped into dicts.
         annual_contrib = sum(c.monthly_amount * 12 for c in contributions)
         annual_costs_val = float(params.get('annual_costs', 0))
-        rental_annual = rental.monthly_income * 12 if rental else 0
-        mortgage_deduction = (rental.mart_share + rental.kerli_share) if rental and rental.sell else 0
-        
-        for i, year in enumerate(result.years):
-            row = {'year': year}
-            
-            # Start balance
-            if i == 0:
-                row['start_balance'] = round(starting_capital, 0)
-            else:
-                row['start_balance'] = round(result.p50[i-1], 0)
-            
-            # Contributions & Costs for this year
-            if year == result.years[0]:
-                months_first_year = 12 - start_month + 1
-                year_contrib = sum(c.monthly_amount for c in contributions) * months_first_year
-                year_costs = (annual_costs_val / 12) * months_first_year
-            else:
-                year_contrib = annual_contrib
-                year_costs = annual_costs_val
-            
-            row['contributions'] = round(year_contrib, 0)
-            row['costs'] = round(-year_costs, 0)  # Store as negative for display
-            
-            # Payouts (Withdrawals) - P50
-            year_payout = result.payouts_p50[i]
-            row['payouts'] = round(-year_payout, 0) # Store as negative
-            
-            # Rental income
-            if rental and rental.include and rental.sell and year >= rental.sale_year:
-                if year == rental.sale_year:
-                     row['rental_income'] = round(rental.monthly_income * 6, 0) # July-Dec
-                else:
-                    row['rental_income'] = round(rental_annual, 0)
-            else:
-                row['rental_income'] = 0
-            
-            # Mortgage deduction
-            if rental and rental.include and rental.sell and year == rental.sale_year:
-                row['mortgage_deduction'] = round(-mortgage_deduction, 0)
-            else:
-                row['mortgage_deduction'] = 0
-            
-            # End balance
-            row['end_balance'] = round(result.p50[i], 0)
-            
-            # Back-calculate effective investment return
-            # known_changes = contributions + rental + mortgage_deduction + costs + payouts
-            known_changes = (row['contributions'] + row['rental_income'] + 
-                           row['mortgage_deduction'] + row['costs'] + row['payouts'])
-            
-            row['investment_return'] = round(row['end_balance'] - row['start_balance'] - known_changes, 0)
-            
-            balance_breakdown.append(row)
+        months_first_year = 12 - start_month + 1
+
+        start_balance = np.empty(n_years)
+        start_balance[0] = starting_capital
+        start_balance[1:] = p50[:-1]
+        end_balance = p50
+
+        contributions_col = np.full(n_years, float(annual_contrib))
+        contributions_col[0] = sum(c.monthly_amount for c in contributions) * months_first_year
+
+        costs_col = np.full(n_years, annual_costs_val)
+        costs_col[0] = (annual_costs_val / 12) * months_first_year
+
+        rental_col = np.zeros(n_years)
+        mortgage_col = np.zeros(n_years)
+        if rental and rental.include and rental.sell:
+            # Sale year: rental income July-Dec only; mortgage deducted once
+            rental_col = np.where(years_arr > rental.sale_year,
+                                  rental.monthly_income * 12.0, 0.0)
+            rental_col = np.where(years_arr == rental.sale_year,
+                                  rental.monthly_income * 6.0, rental_col)
+            mortgage_col = np.where(years_arr == rental.sale_year,
+                                    -(rental.mart_share + rental.kerli_share), 0.0)
+
+        # Back-calculate effective investment return
+        # known_changes = contributions + rental + mortgage_deduction + costs + payouts
+        known_changes = contributions_col + rental_col + mortgage_col - costs_col - payouts
+        investment_return = end_balance - start_balance - known_changes
+
+        # One batched round + int conversion per column instead of ~8
+        # Python-level round() calls per year. Costs/payouts are stored
+        # as negatives for display.
+        columns = (start_balance, contributions_col, -costs_col, -payouts,
+                   rental_col, mortgage_col, end_balance, investment_return)
+        rounded = [np.round(col, 0).astype(np.int64).tolist() for col in columns]
+
+        balance_breakdown = [
+            {
+                'year': year,
+                'start_balance': sb,
+                'contributions': co,
+                'costs': cs,
+                'payouts': po,
+                'rental_income': ri,
+                'mortgage_deduction': md,
+                'end_balance': eb,
+                'investment_return': ir
+            }
+            for year, sb, co, cs, po, ri, md, eb, ir
+            in zip(result.years, *rounded)
+        ]
         
         return jsonify({
             'success': True,
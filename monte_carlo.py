@@ -4,46 +4,68 @@ Monte Carlo Simulation Engine for Investment Projections.
 Uses historical return and volatility to simulate future outcomes.
 """
 
+import base64
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; fall back to the pure-Python loop
+    _HAVE_NUMBA = False
+    prange = range
+
 
 @dataclass
 class SimulationResult:
     """Container for Monte Carlo simulation results."""
     years: list[int]
-    p2: list[float]   # 2nd percentile (extreme pessimistic)
-    p10: list[float]  # 10th percentile (pessimistic)
-    p50: list[float]  # 50th percentile (median/expected)
-    p90: list[float]  # 90th percentile (optimistic)
-    p98: list[float]  # 98th percentile (extreme optimistic)
-    mean: list[float]  # Mean across all simulations
-    percentiles: dict[str, list[float]]  # Full percentile range p0-p100
-    payouts_p50: list[float]  # Median annual payout
+    p2: np.ndarray   # 2nd percentile (extreme pessimistic)
+    p10: np.ndarray  # 10th percentile (pessimistic)
+    p50: np.ndarray  # 50th percentile (median/expected)
+    p90: np.ndarray  # 90th percentile (optimistic)
+    p98: np.ndarray  # 98th percentile (extreme optimistic)
+    mean: np.ndarray  # Mean across all simulations
+    percentiles: Optional[np.ndarray]  # (101, n_years) full p0-p100 sweep, if computed
+    payouts_p50: np.ndarray  # Median annual payout
     all_paths: Optional[np.ndarray] = None  # Full simulation data if requested
-    
+
     def to_dict(self, include_paths: bool = False) -> dict:
         """Convert to dictionary for JSON serialization."""
+        # np.round(...).tolist() rounds a whole series in one C call;
+        # the old per-element round() loops were ~700 Python calls
         result = {
             'years': self.years,
-            'p2': [round(v, 2) for v in self.p2],
-            'p10': [round(v, 2) for v in self.p10],
-            'p50': [round(v, 2) for v in self.p50],
-            'p90': [round(v, 2) for v in self.p90],
-            'p98': [round(v, 2) for v in self.p98],
-            'mean': [round(v, 2) for v in self.mean],
-            'payouts_p50': [round(v, 2) for v in self.payouts_p50],
-            'percentiles': {k: [round(v, 2) for v in vals] for k, vals in self.percentiles.items()}
+            'p2': np.round(self.p2, 2).tolist(),
+            'p10': np.round(self.p10, 2).tolist(),
+            'p50': np.round(self.p50, 2).tolist(),
+            'p90': np.round(self.p90, 2).tolist(),
+            'p98': np.round(self.p98, 2).tolist(),
+            'mean': np.round(self.mean, 2).tolist(),
+            'payouts_p50': np.round(self.payouts_p50, 2).tolist(),
         }
+        if self.percentiles is not None:
+            result['percentiles'] = {f'p{i}': row.tolist()
+                                     for i, row in enumerate(np.round(self.percentiles, 2))}
         if include_paths and self.all_paths is not None:
-            result['paths'] = self.all_paths.tolist()
+            # Raw float32 bytes, not tolist(): a Python list-of-lists of
+            # a multi-million-cell array costs 10-20x the array's memory.
+            # Decode with np.frombuffer(base64.b64decode(paths_b64),
+            # dtype=np.float32).reshape(paths_shape).
+            raw = np.ascontiguousarray(self.all_paths, dtype=np.float32)
+            result['paths_b64'] = base64.b64encode(raw.tobytes()).decode('ascii')
+            result['paths_shape'] = list(raw.shape)
         return result
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PortfolioETF:
     """Single ETF in a portfolio."""
     isin: str
@@ -52,7 +74,7 @@ class PortfolioETF:
     annual_volatility: float  # Decimal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RentalProperty:
     """Rental property configuration."""
     include: bool
@@ -66,13 +88,177 @@ class RentalProperty:
     kerli_share: float  # Kerli's share
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class Contribution:
     """Monthly contribution from a person."""
     name: str
     monthly_amount: float
 
 
+# Reusable per-thread output buffers keyed on shape: repeated simulate()
+# calls with the same configuration (the common UI pattern) skip the
+# (n_simulations, n_years) allocation and page-faulting entirely.
+# Thread-local so concurrent request threads never share a buffer.
+_BUFFERS = threading.local()
+
+
+def _get_buffers(shape: tuple[int, int]) -> tuple[np.ndarray, np.ndarray]:
+    cache = getattr(_BUFFERS, 'cache', None)
+    if cache is None:
+        cache = _BUFFERS.cache = {}
+    bufs = cache.get(shape)
+    if bufs is None:
+        bufs = cache[shape] = (np.zeros(shape, dtype=np.float32),
+                               np.zeros(shape, dtype=np.float32))
+    return bufs
+
+
+# Persistent worker pool shared across simulate() calls; created lazily so
+# importing this module never forks
+_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _limit_worker_threads() -> None:
+    """Pool worker init: one numba thread per worker.
+
+    Sharding already assigns one worker per core; letting each worker's
+    parallel kernel fan out across all cores again would oversubscribe
+    them N-fold.
+    """
+    if _HAVE_NUMBA:
+        # Imported here, not at module top: pulling in set_num_threads
+        # eagerly initializes numba's parallel machinery, which brings
+        # back the shutdown hang the serial/parallel kernel split avoids
+        from numba import set_num_threads
+        set_num_threads(1)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        # spawn, not fork: forking a process whose numba threading layer
+        # is already initialized leaves broken locks in the children and
+        # hangs interpreter shutdown. Seeds are explicit, so spawned
+        # workers produce identical results.
+        _POOL = ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_limit_worker_threads
+        )
+    return _POOL
+
+
+def _simulate_chunk(
+    simulator: 'MonteCarloSimulator',
+    n_chunk: int,
+    seed: int,
+    sim_kwargs: dict
+) -> tuple[np.ndarray, np.ndarray]:
+    """Worker entry point: generate one batch of paths (picklable target)."""
+    return simulator.simulate_paths(n_chunk, seed=seed, **sim_kwargs)
+
+
+def _make_simulate_kernel(parallel: bool):
+    """
+    Return a fresh function object for the simulation kernel.
+
+    The kernel is compiled twice below (a parallel and a serial build),
+    and numba's on-disk cache keys entries by signature, target and the
+    function's bytecode and closure contents - compiler flags are not
+    part of the key. Built from one shared function object, the two
+    builds would collide in the cache and whichever compiled first would
+    be silently loaded for both, handing parallel machine code to
+    non-main threads. Closing over `parallel` keeps their entries apart.
+    """
+
+    def _simulate_kernel(
+        shocks: np.ndarray,          # (n_paths, n_years, 12) pre-drawn monthly returns
+        paths: np.ndarray,           # (n_paths, n_years) float32 output, fully overwritten
+        payouts_paths: np.ndarray,   # (n_paths, n_years) float32 output, fully overwritten
+        starting_capital: float,
+        contrib_by_year: np.ndarray,  # (n_years,) monthly contribution per year
+        cost_per_month: float,
+        first_month: int,            # 0-based month offset for the first year
+        withdrawal_rate: float,
+        wd_start_idx: int,           # first year index with withdrawals (>=n_years = never)
+        payout_net_factor: float,    # 0.78 for dividend mode, 1.0 for loan
+        sale_year_idx: int,          # rental sale year index (n_years = no rental)
+        rental_monthly_income: float,
+        rental_mortgage_total: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Hot path of the simulation as a plain-numeric kernel.
+
+        Mirrors the monthly loop in simulate_paths but takes only plain
+        arrays and scalars so numba can compile it (prange over paths,
+        serial over time). The contribution Stop/Change rules arrive
+        pre-resolved as a per-year schedule and calendar years as indices
+        relative to the start year, so the loop body carries no Optional
+        handling at all. Outputs are written into the caller-provided
+        paths/payouts_paths arrays (every cell is assigned, so reused
+        buffers need no zeroing).
+        """
+        parallel  # referenced only to land in __closure__ (see above)
+        n_paths = shocks.shape[0]
+        n_years = shocks.shape[1]
+
+        for sim in prange(n_paths):
+            balance = starting_capital
+
+            for year_idx in range(n_years):
+                month_from = first_month if year_idx == 0 else 0
+                contrib = contrib_by_year[year_idx]
+
+                # Withdraw only from positive balances: a path that has gone
+                # negative must not get cash injected by a negative withdrawal
+                monthly_wd = 0.0
+                if year_idx >= wd_start_idx and withdrawal_rate > 0 and balance > 0:
+                    monthly_wd = balance * withdrawal_rate / 12
+
+                # Fixed monthly cashflow for this year, resolved once
+                cash = contrib - cost_per_month - monthly_wd
+
+                for month in range(month_from, 12):
+                    balance += cash
+
+                    if year_idx > sale_year_idx:
+                        balance += rental_monthly_income
+                    elif year_idx == sale_year_idx and month >= 6:
+                        balance += rental_monthly_income
+                        if month == 6:
+                            balance -= rental_mortgage_total
+
+                    balance *= 1.0 + shocks[sim, year_idx, month]
+
+                paths[sim, year_idx] = balance
+                payouts_paths[sim, year_idx] = (monthly_wd * (12 - month_from)
+                                                * payout_net_factor)
+
+        return paths, payouts_paths
+
+    return _simulate_kernel
+
+
+if _HAVE_NUMBA:
+    # Two compiled builds of the kernel. The prange build uses numba's
+    # default workqueue threading layer, which must only be entered from
+    # a main thread - calling it from e.g. a request worker thread wedges
+    # the interpreter at shutdown. Non-main threads get a serial build
+    # (prange degrades to range) and rely on process sharding in
+    # simulate() for parallelism.
+    _simulate_kernel_parallel = njit(parallel=True, cache=True, fastmath=True)(
+        _make_simulate_kernel(parallel=True))
+    _simulate_kernel_serial = njit(cache=True, fastmath=True)(
+        _make_simulate_kernel(parallel=False))
+
+
+def _pick_kernel():
+    """Select the compiled kernel build that is safe for this thread."""
+    if threading.current_thread() is threading.main_thread():
+        return _simulate_kernel_parallel
+    return _simulate_kernel_serial
+
+
 class MonteCarloSimulator:
     """Monte Carlo simulation engine for investment projections."""
     
@@ -98,9 +284,11 @@ class MonteCarloSimulator:
         self.contributions = contributions
         self.rental = rental
         self.n_simulations = n_simulations
-        
-        if seed is not None:
-            np.random.seed(seed)
+        # All randomness flows through np.random.default_rng(seed) (PCG64)
+        # inside simulate_paths - faster Gaussian draws than the legacy
+        # global Mersenne Twister, reproducible per call, and parallel
+        # workers derive independent streams from distinct seeds.
+        self.seed = seed
         
         # Calculate portfolio-level return and volatility
         self.portfolio_return = self._calculate_portfolio_return()
@@ -125,24 +313,325 @@ class MonteCarloSimulator:
         return np.sqrt(variance)
     
     def _calculate_mortgage_balance(self, year: int) -> float:
-        """Calculate remaining mortgage balance at start of year."""
+        """
+        Calculate remaining mortgage balance at start of year.
+
+        Uses the closed-form annuity balance
+        B_n = B_0 (1+r)^n - P ((1+r)^n - 1) / r
+        instead of amortizing month by month, so the cost is one
+        exponentiation regardless of horizon.
+        """
         if not self.rental or not self.rental.include:
             return 0.0
-        
+
         months = (year - 2026) * 12
-        balance = self.rental.mortgage_2026
+        if months <= 0:
+            return self.rental.mortgage_2026
+
         monthly_rate = self.rental.interest_rate / 12
-        
-        for _ in range(months):
-            if balance <= 0:
-                break
-            interest = balance * monthly_rate
-            principal = self.rental.monthly_payment - interest
-            balance -= principal
-            balance = max(0, balance)
-        
-        return balance
+        if monthly_rate == 0:
+            # Linear amortization when there is no interest
+            balance = self.rental.mortgage_2026 - self.rental.monthly_payment * months
+        else:
+            growth = (1 + monthly_rate) ** months
+            balance = (self.rental.mortgage_2026 * growth
+                       - self.rental.monthly_payment * (growth - 1) / monthly_rate)
+
+        return max(0.0, balance)
     
+    def simulate_paths(
+        self,
+        n_paths: int,
+        seed: Optional[int] = None,
+        start_year: int = 2026,
+        start_month: int = 1,  # 1=January, 12=December
+        end_year: int = 2040,
+        starting_capital: float = 82964.0,
+        annual_costs: float = 0.0,
+        withdrawal_rate: float = 0.0,  # 0.04 = 4%
+        withdrawal_start_year: int = 2035,
+        withdrawal_mode: str = 'loan',  # 'loan' or 'dividend'
+        contribution_end_year: Optional[int] = None,
+        contribution_change_year: Optional[int] = None,
+        contribution_change_factor: float = 1.0,
+        antithetic: bool = False,
+        out_paths: Optional[np.ndarray] = None,
+        out_payouts: Optional[np.ndarray] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Generate raw simulation paths without percentile reduction.
+
+        Paths are independent, so callers can shard n_paths across worker
+        processes (with distinct seeds), concatenate the returned arrays
+        along axis 0 and reduce once via reduce_paths().
+
+        Args:
+            n_paths: Number of paths to generate in this batch
+            seed: Random seed for this batch (give each worker its own)
+            antithetic: Mirror each drawn shock sequence (z and -z),
+                halving RNG work and reducing percentile-estimate
+                variance; the normal distribution is symmetric so the
+                marginal path distribution is unchanged
+            out_paths: Optional float32 (n_paths, n_years) buffer to fill
+                instead of allocating; contents are overwritten
+            out_payouts: Same, for the payout array
+
+        Returns:
+            (paths, payouts_paths), both of shape (n_paths, n_years)
+        """
+        years = list(range(start_year, end_year + 1))
+        n_years = len(years)
+
+        # Initialize paths arrays: (n_paths, n_years), ending balance per
+        # year. float32 throughout the path tensors: ~7 significant digits
+        # comfortably covers values reported rounded to cents, and
+        # half-width rows double the effective SIMD throughput of the
+        # memory-bound monthly step. Callers may hand in buffers from a
+        # previous same-shape run to skip the allocation.
+        if out_paths is None:
+            paths = np.zeros((n_paths, n_years), dtype=np.float32)
+        else:
+            paths = out_paths
+            paths.fill(0)
+        if out_payouts is None:
+            payouts_paths = np.zeros((n_paths, n_years), dtype=np.float32)
+        else:
+            payouts_paths = out_payouts
+            payouts_paths.fill(0)
+
+        # Monthly volatility. Plain Python floats: a np.float64 scalar
+        # would silently promote every float32 vector op back to float64.
+        monthly_vol = float(self.portfolio_volatility / np.sqrt(12))
+        monthly_return = self.portfolio_return / 12
+
+        # The contribution list never changes mid-simulation; sum it once
+        base_monthly_contrib = float(sum(c.monthly_amount for c in self.contributions))
+
+        # Resolve the Stop/Change rules to a per-year schedule up front.
+        # They depend only on the year, so evaluating them once here
+        # replaces re-branching on every (path, year, month) step.
+        contrib_by_year = np.full(n_years, base_monthly_contrib, dtype=np.float64)
+        for i, year in enumerate(years):
+            if contribution_end_year is not None and year >= contribution_end_year:
+                contrib_by_year[i] = 0.0
+            elif (contribution_change_year is not None and
+                  year >= contribution_change_year):
+                contrib_by_year[i] = base_monthly_contrib * contribution_change_factor
+
+        cost_per_month = annual_costs / 12.0
+
+        rng = np.random.default_rng(seed)
+
+        def draw_normals(shape: tuple[int, ...]) -> np.ndarray:
+            """Draw standard normals, antithetic (z paired with -z) on request."""
+            if not antithetic:
+                return rng.standard_normal(shape, dtype=np.float32)
+            n = shape[0]
+            half = rng.standard_normal((n - n // 2,) + shape[1:], dtype=np.float32)
+            return np.concatenate([half, -half[:n // 2]], axis=0)
+
+        if _HAVE_NUMBA:
+            # Kernel path: draw every monthly shock in one batched call.
+            # float32 halves the bandwidth of the dominant working set and
+            # is plenty for reporting rounded to 2 decimals; rescale to
+            # N(monthly_return, monthly_vol) in place to avoid temporaries.
+            shocks = draw_normals((n_paths, n_years, 12))
+            np.multiply(shocks, monthly_vol, out=shocks)
+            np.add(shocks, monthly_return, out=shocks)
+
+            # Hand the loop to the compiled kernel with the precomputed
+            # schedule, calendar years resolved to indices, and plain floats.
+            rental_active = bool(self.rental and self.rental.include
+                                 and self.rental.sell)
+            return _pick_kernel()(
+                shocks,
+                paths,
+                payouts_paths,
+                float(starting_capital),
+                contrib_by_year,
+                cost_per_month,
+                start_month - 1,
+                float(withdrawal_rate),
+                withdrawal_start_year - start_year,
+                0.78 if withdrawal_mode == 'dividend' else 1.0,
+                self.rental.sale_year - start_year if rental_active else n_years,
+                self.rental.monthly_income if rental_active else 0.0,
+                (self.rental.mart_share + self.rental.kerli_share) if rental_active else 0.0
+            )
+
+        # Vectorized across paths: balance is one (n_paths,) vector and the
+        # monthly step broadcasts over it. Every cashflow decision depends
+        # only on (year, month), never on the individual path, so all the
+        # branching stays outside the path axis.
+        balance = np.full(n_paths, starting_capital, dtype=np.float32)
+
+        # Rental cashflow per (year, month), resolved once. Sale-year
+        # timing: income starts July (month 6), the one-shot mortgage
+        # payoff (Mart+Kerli shares) lands on July 1, full income in all
+        # later years. If sell=False the OÜ receives nothing and the
+        # matrix stays zero.
+        rental_cf = np.zeros((n_years, 12))
+        if self.rental and self.rental.include and self.rental.sell:
+            sy = self.rental.sale_year - start_year
+            if sy < 0:
+                rental_cf[:, :] = self.rental.monthly_income
+            elif sy < n_years:
+                rental_cf[sy, 6:] += self.rental.monthly_income
+                rental_cf[sy, 6] -= (self.rental.mart_share +
+                                     self.rental.kerli_share)
+                rental_cf[sy + 1:, :] = self.rental.monthly_income
+
+        # Active-month mask with the partial first year baked in, so the
+        # monthly loop below is uniform across years: pre-start months get
+        # zero cashflow and zero drift/shock (an exact multiply by 1.0)
+        # instead of a year == start_year special case per iteration.
+        active = np.ones((n_years, 12), dtype=bool)
+        fm = start_month - 1
+        if fm:
+            active[0, :fm] = False
+        months_active = active.sum(axis=1)
+
+        cash_cf = contrib_by_year[:, None] - cost_per_month + rental_cf
+        cash_cf[~active] = 0.0
+        drift = np.full((n_years, 12), monthly_return, dtype=np.float32)
+        drift[~active] = 0.0
+
+        # Annual lognormal parameters for the fused fast path below. The
+        # Itô correction (-sigma^2/2 per month) makes one exp() draw match
+        # the compounded arithmetic monthly model in expectation.
+        mu_annual = 12 * monthly_return - 0.5 * 12 * monthly_vol ** 2
+        sigma_annual = float(monthly_vol * np.sqrt(12))
+
+        for year_idx, year in enumerate(years):
+            monthly_contrib = contrib_by_year[year_idx]
+
+            # Calculate annual withdrawal budget for this year (per path).
+            # Clamped at zero so paths with a negative balance withdraw
+            # nothing instead of having cash injected.
+            if year >= withdrawal_start_year and withdrawal_rate > 0:
+                monthly_wd = np.maximum(balance, 0) * (withdrawal_rate / 12)
+            else:
+                monthly_wd = None
+
+            # Fast path for "quiet" years: no withdrawals, no rental
+            # cashflows, all 12 months simulated. The product of 12 monthly
+            # factors collapses to a single annual lognormal draw, and the
+            # constant monthly cashflow enters as an annuity future value
+            # under the realized growth - one RNG draw instead of 12.
+            quiet = (monthly_wd is None
+                     and not rental_cf[year_idx].any()
+                     and months_active[year_idx] == 12)
+            if quiet:
+                cash = float(monthly_contrib - cost_per_month)
+
+                # rng.lognormal fuses draw, scale and exp into one C pass;
+                # the antithetic branch needs the raw normals to mirror,
+                # so it keeps the explicit exp
+                if antithetic:
+                    growth = np.exp(mu_annual +
+                                    sigma_annual * draw_normals((n_paths,)))
+                else:
+                    growth = rng.lognormal(mean=mu_annual, sigma=sigma_annual,
+                                           size=n_paths).astype(np.float32)
+                g = growth ** (1.0 / 12.0)  # implied monthly factor
+                # FV of an annuity paid at the start of each month:
+                # cash*(g + g^2 + ... + g^12) = cash * g * (growth-1)/(g-1)
+                denom = g - 1.0
+                # Guard the denominator before dividing (np.where evaluates
+                # both branches); growth can land exactly on 1.0 in float32
+                flat = np.abs(denom) <= 1e-12
+                annuity = np.where(flat, 12.0,
+                                   g * (growth - 1.0) / np.where(flat, 1.0, denom))
+                balance = balance * growth + cash * annuity
+                paths[:, year_idx] = balance
+                continue  # payouts stay 0 - no withdrawals in quiet years
+
+            # Slow path: month-by-month over a uniform 12-month range.
+            # Pre-start months were zeroed in the schedules (and get their
+            # shock column zeroed here), so they multiply the balance by
+            # exactly 1.0 and add nothing.
+            z = draw_normals((n_paths, 12))
+            active_row = active[year_idx]
+            if months_active[year_idx] < 12:
+                z[:, ~active_row] = 0.0
+            drift_row = drift[year_idx]
+
+            for month in range(12):
+                balance += cash_cf[year_idx, month]
+
+                # Deduct monthly withdrawal (only in simulated months)
+                if monthly_wd is not None and active_row[month]:
+                    balance -= monthly_wd
+
+                # Investment return (with randomness) across all paths
+                balance *= 1.0 + (drift_row[month] + monthly_vol * z[:, month])
+
+            # Store ending balance
+            paths[:, year_idx] = balance
+
+            # Store annual payout (Net): the same monthly withdrawal was
+            # taken every simulated month, so the gross is one multiply.
+            # Dividend mode nets 22/78 rule: Net = Gross * 0.78 (approx).
+            if monthly_wd is not None:
+                year_payout_gross = monthly_wd * float(months_active[year_idx])
+                if withdrawal_mode == 'dividend':
+                    payouts_paths[:, year_idx] = year_payout_gross * 0.78
+                else:
+                    payouts_paths[:, year_idx] = year_payout_gross
+
+        return paths, payouts_paths
+
+    @staticmethod
+    def reduce_paths(
+        years: list[int],
+        paths: np.ndarray,
+        payouts_paths: np.ndarray,
+        include_full_percentiles: bool = True
+    ) -> SimulationResult:
+        """
+        Reduce raw (merged) path arrays to a SimulationResult.
+
+        With include_full_percentiles the whole p0-p100 sweep is computed
+        in one np.percentile call (a single sort per column); the UI's
+        scenario slider needs this, so it is the default. Headline-only
+        callers can pass False to get just p2/p10/p50/p90/p98 via an O(n)
+        partition instead of a full sort.
+        """
+        if include_full_percentiles:
+            all_percentiles = np.percentile(paths, np.arange(101), axis=0)
+            headline = {q: all_percentiles[q] for q in (2, 10, 50, 90, 98)}
+        else:
+            # Selection, not sorting: partition at the ranks bracketing
+            # each quantile and blend exactly like np.percentile's linear
+            # interpolation.
+            all_percentiles = None
+            n = paths.shape[0]
+            quantiles = (2, 10, 50, 90, 98)
+            positions = {q: q / 100 * (n - 1) for q in quantiles}
+            ranks = sorted({r for p in positions.values()
+                            for r in (int(np.floor(p)), int(np.ceil(p)))})
+            part = np.partition(paths, ranks, axis=0)
+            headline = {}
+            for q, p in positions.items():
+                lo, hi = int(np.floor(p)), int(np.ceil(p))
+                row = part[lo]
+                if hi != lo:
+                    row = row + (p - lo) * (part[hi] - part[lo])
+                headline[q] = row
+
+        return SimulationResult(
+            years=years,
+            p2=headline[2],
+            p10=headline[10],
+            p50=headline[50],
+            p90=headline[90],
+            p98=headline[98],
+            mean=np.mean(paths, axis=0, dtype=np.float64),
+            percentiles=all_percentiles,
+            payouts_p50=np.median(payouts_paths, axis=0),
+            all_paths=paths
+        )
+
     def simulate(
         self,
         start_year: int = 2026,
@@ -156,142 +645,85 @@ class MonteCarloSimulator:
         withdrawal_mode: str = 'loan',  # 'loan' or 'dividend'
         contribution_end_year: Optional[int] = None,
         contribution_change_year: Optional[int] = None,
-        contribution_change_factor: float = 1.0
+        contribution_change_factor: float = 1.0,
+        antithetic: bool = False,
+        num_workers: Optional[int] = 1,
+        include_full_percentiles: bool = True
     ) -> SimulationResult:
         """
         Run Monte Carlo simulation.
-        
+
         Args:
             start_year: First year of simulation
             start_month: Month to start (1-12, default 1=January)
             end_year: Last year of simulation
             starting_capital: Initial capital in OÜ
             starting_loans: Initial loans per person
-            
+            antithetic: Pair each shock sequence with its mirror image
+                (variance reduction, half the RNG draws)
+            num_workers: Process count for path generation; 1 runs
+                in-process (default), None auto-detects CPU cores
+            include_full_percentiles: Compute the whole p0-p100 sweep
+                (default); False keeps only the headline percentiles via
+                a cheaper partition
+
         Returns:
             SimulationResult with percentile paths
         """
         years = list(range(start_year, end_year + 1))
-        n_years = len(years)
-        
-        # Initialize paths array: (n_simulations, n_years)
-        # Store ending balance for each year
-        paths = np.zeros((self.n_simulations, n_years))
-        payouts_paths = np.zeros((self.n_simulations, n_years))
-        
-        # Annual contribution total
-        annual_contribution = sum(c.monthly_amount * 12 for c in self.contributions)
-        
-        # Monthly volatility
-        monthly_vol = self.portfolio_volatility / np.sqrt(12)
-        monthly_return = self.portfolio_return / 12
-        
-        for sim in range(self.n_simulations):
-            balance = starting_capital
-            
-            for year_idx, year in enumerate(years):
-                # Monthly simulation for this year
-                year_start_balance = balance
-                
-                # First year: start from start_month, otherwise full year
-                first_month = (start_month - 1) if year == start_year else 0
-                
-                # Calculate annual withdrawal budget for this year
-                year_withdrawal_budget = 0.0
-                if year >= withdrawal_start_year and withdrawal_rate > 0:
-                    year_withdrawal_budget = balance * withdrawal_rate
-                
-                year_payout_gross = 0.0
-                
-
-                for month in range(first_month, 12):
-                    # Monthly contribution calculation
-                    current_monthly_contrib = sum(c.monthly_amount for c in self.contributions)
-                    
-                    # Logic 1: Stop Contributions
-                    if contribution_end_year is not None and year >= contribution_end_year:
-                        current_monthly_contrib = 0.0
-                    
-                    # Logic 2: Change Contribution Rate
-                    elif (contribution_change_year is not None and 
-                          year >= contribution_change_year):
-                        current_monthly_contrib *= contribution_change_factor
-                    
-                    balance += current_monthly_contrib
-                    
-                    # Deduct monthly share of annual costs
-                    balance -= (annual_costs / 12)
-                    
-                    # Deduct monthly withdrawal
-                    if year_withdrawal_budget > 0:
-                        monthly_wd = year_withdrawal_budget / 12
-                        balance -= monthly_wd
-                        year_payout_gross += monthly_wd
-                    
-                    # Rental income logic (mid-year timing for sale year):
-                    # If sell=True (OÜ pays mortgage): OÜ gets full rental income after repayment
-                    # If sell=False (personal payment): OÜ gets nothing
-                    if self.rental and self.rental.include and self.rental.sell:
-                        if year > self.rental.sale_year:
-                             # Full year after repayment - get all months
-                            balance += self.rental.monthly_income
-                        elif year == self.rental.sale_year and month >= 6:
-                            # Sale year - rental income starts from July (month 6)
-                            balance += self.rental.monthly_income
-                    
-                    # Mid-year mortgage deduction (July 1 = month 6)
-                    if self.rental and self.rental.include and self.rental.sell:
-                        if year == self.rental.sale_year and month == 6:
-                            # Deduct mortgage from balance mid-year
-                            balance -= (self.rental.mart_share + self.rental.kerli_share)
-                    
-                    # Investment return (with randomness)
-                    random_return = np.random.normal(monthly_return, monthly_vol)
-                    balance *= (1 + random_return)
-                
-                # Store ending balance
-                paths[sim, year_idx] = balance
-                
-                # Store annual payout (Net)
-                if withdrawal_mode == 'dividend':
-                    # 22/78 rule: Net = Gross * 0.78 (approx)
-                    # Actually if 22/78 is ratio, then Net = Gross * (78/100)
-                    payouts_paths[sim, year_idx] = year_payout_gross * 0.78
-                else:
-                     # Loan repayment: Net = Gross
-                    payouts_paths[sim, year_idx] = year_payout_gross
-        
-        # Calculate percentiles
-        p2 = np.percentile(paths, 2, axis=0).tolist()
-        p10 = np.percentile(paths, 10, axis=0).tolist()
-        p50 = np.percentile(paths, 50, axis=0).tolist()
-        p90 = np.percentile(paths, 90, axis=0).tolist()
-        p98 = np.percentile(paths, 98, axis=0).tolist()
-        mean = np.mean(paths, axis=0).tolist()
-        
-        payouts_p50 = np.percentile(payouts_paths, 50, axis=0).tolist()
-        
-        # Calculate full range of percentiles
-        percentiles = {}
-        # Calculate in steps of 1%
-        for i in range(101):
-            key = f'p{i}'
-            values = np.percentile(paths, i, axis=0).tolist()
-            percentiles[key] = values
-
-        return SimulationResult(
-            years=years,
-            p2=p2,
-            p10=p10,
-            p50=p50,
-            p90=p90,
-            p98=p98,
-            mean=mean,
-            percentiles=percentiles,
-            payouts_p50=payouts_p50,
-            all_paths=paths
+        sim_kwargs = dict(
+            start_year=start_year,
+            start_month=start_month,
+            end_year=end_year,
+            starting_capital=starting_capital,
+            annual_costs=annual_costs,
+            withdrawal_rate=withdrawal_rate,
+            withdrawal_start_year=withdrawal_start_year,
+            withdrawal_mode=withdrawal_mode,
+            contribution_end_year=contribution_end_year,
+            contribution_change_year=contribution_change_year,
+            contribution_change_factor=contribution_change_factor,
+            antithetic=antithetic
         )
 
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        num_workers = min(num_workers, self.n_simulations)
+
+        if num_workers <= 1:
+            # Reuse this thread's output buffers across calls.
+            out_paths, out_payouts = _get_buffers(
+                (self.n_simulations, len(years)))
+            paths, payouts_paths = self.simulate_paths(
+                self.n_simulations, seed=self.seed,
+                out_paths=out_paths, out_payouts=out_payouts, **sim_kwargs)
+            result = self.reduce_paths(years, paths, payouts_paths,
+                                       include_full_percentiles)
+            # all_paths would alias the buffer and be overwritten by this
+            # thread's next same-shape run; the reductions above are the
+            # only consumers, so drop the reference rather than copy 10k
+            # paths per request.
+            result.all_paths = None
+            return result
+
+        # Paths are independent: split them across workers, each with a
+        # seed spawned from the simulator's seed sequence (so seeded runs
+        # stay reproducible), then merge and reduce once.
+        base, extra = divmod(self.n_simulations, num_workers)
+        counts = [base + (1 if i < extra else 0) for i in range(num_workers)]
+        children = np.random.SeedSequence(self.seed).spawn(num_workers)
+        seeds = [int(child.generate_state(1)[0]) for child in children]
+
+        futures = [
+            _get_pool().submit(_simulate_chunk, self, n, s, sim_kwargs)
+            for n, s in zip(counts, seeds) if n > 0
+        ]
+        chunks = [f.result() for f in futures]
+        paths = np.concatenate([c[0] for c in chunks], axis=0)
+        payouts_paths = np.concatenate([c[1] for c in chunks], axis=0)
+        return self.reduce_paths(years, paths, payouts_paths,
+                                 include_full_percentiles)
+
 
 def calculate_loan_evolution(
     starting_loans: dict[str, float],
@@ -305,71 +737,76 @@ def calculate_loan_evolution(
     contribution_end_year: Optional[int] = None,
     contribution_change_year: Optional[int] = None,
     contribution_change_factor: float = 1.0
-) -> dict[str, list[float]]:
+) -> tuple[list[str], np.ndarray]:
     """
     Calculate evolution of loans (principal + contributions).
-    
+
+    Loans are kept structure-of-arrays style: one (n_persons, n_years)
+    float64 matrix instead of a dict of per-person lists, so callers can
+    reduce across persons with a single arr.sum(axis=0).
+
     Args:
         starting_loans: Initial loan amounts
         contributions: Monthly contributions
         years: List of simulation years
         rental: Rental property config
         start_month: Start month (1-12) for the first year
-        
+
     Returns:
-        Dictionary of loan balances per person per year
+        (names, history) where history[j, i] is the loan balance of
+        names[j] at the end of years[i]
     """
-    # Map contributions to persons
+    names = list(starting_loans.keys())
+
+    # Current balances and monthly contributions as person vectors
+    current = np.array([starting_loans[n] for n in names], dtype=np.float64)
     contrib_map = {c.name: c.monthly_amount for c in contributions}
-    
-    loan_evolution = {name: [] for name in starting_loans.keys()}
-    
-    # Initialize current loans
-    current_loans = starting_loans.copy()
-    
+    contrib = np.array([contrib_map.get(n, 0.0) for n in names], dtype=np.float64)
+
+    history = np.empty((len(names), len(years)), dtype=np.float64)
+
+    # Rental repayment targets (Mart/Kerli), resolved to indices up front
+    mart_idx = names.index('Mart') if 'Mart' in names else -1
+    kerli_idx = names.index('Kerli') if 'Kerli' in names else -1
+
+    # Effective contribution months per year (Stop/Change rules and the
+    # partial first year), resolved outside the loop like simulate does
+    contrib_months = np.empty(len(years), dtype=np.float64)
+    for i, year in enumerate(years):
+        months = 12 if year != years[0] else 12 - start_month + 1
+        if contribution_end_year is not None and year >= contribution_end_year:
+            contrib_months[i] = 0.0
+        elif (contribution_change_year is not None and
+              year >= contribution_change_year):
+            contrib_months[i] = months * contribution_change_factor
+        else:
+            contrib_months[i] = months
+
     for year_idx, year in enumerate(years):
-        # Calculate contribution months for this year
-        months = 12
-        if year == years[0]:
-            months = 12 - start_month + 1
-        
-        # 1. Add Contributions
-        for person in current_loans:
-            monthly = contrib_map.get(person, 0)
-            
-            # Logic: Stop/Change Contributions (Same as simulate)
-            if contribution_end_year is not None and year >= contribution_end_year:
-                monthly = 0.0
-            elif (contribution_change_year is not None and 
-                  year >= contribution_change_year):
-                monthly *= contribution_change_factor
-                
-            current_loans[person] += monthly * months
-            
+        # 1. Add Contributions (one vector op per year)
+        current += contrib * contrib_months[year_idx]
+
         # 2. Subtract Rental Repayment (Mart/Kerli)
         if rental and rental.include and rental.sell and year == rental.sale_year:
-            if 'Mart' in current_loans:
-                current_loans['Mart'] -= rental.mart_share
-            if 'Kerli' in current_loans:
-                current_loans['Kerli'] -= rental.kerli_share
-        
+            if mart_idx >= 0:
+                current[mart_idx] -= rental.mart_share
+            if kerli_idx >= 0:
+                current[kerli_idx] -= rental.kerli_share
+
         # 3. Subtract Loan Repayment (Withdrawals) if mode='loan'
-        if withdrawal_mode == 'loan' and payouts and year_idx < len(payouts):
+        if withdrawal_mode == 'loan' and payouts is not None and year_idx < len(payouts):
             payout_amount = payouts[year_idx]
             if payout_amount > 0:
-                total_loan = sum(current_loans.values())
+                total_loan = current.sum()
                 if total_loan > 0:
-                    # Reduce properly proportionally
-                    # If payout > total_loan, we reduce to 0 (excess is dividend logic, but here we just zero out)
-                    factor = max(0.0, (total_loan - payout_amount) / total_loan)
-                    for person in current_loans:
-                        current_loans[person] *= factor
-        
+                    # Reduce proportionally; if payout > total_loan we
+                    # reduce to 0 (excess is dividend logic)
+                    current *= max(0.0, (total_loan - payout_amount) / total_loan)
+
         # Store snapshot
-        for person in current_loans:
-            loan_evolution[person].append(current_loans[person])
-            
-    return loan_evolution
+        history[:, year_idx] = current
+
+    return names, history
 
 
 if __name__ == "__main__":
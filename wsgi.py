@@ -0,0 +1,12 @@
+"""
+WSGI entry point for production servers.
+
+The Werkzeug dev server (python app.py) is single-threaded: one running
+simulation blocks every other request. In production run the app under
+gunicorn; each simulate request shards its paths across all cores, so a
+small worker count suffices:
+
+    gunicorn -w 2 -k gthread --threads 4 wsgi:application
+"""
+
+from app import app as application